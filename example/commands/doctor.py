@@ -14,21 +14,22 @@
 
 """example doctor サブコマンドモジュール"""
 
-import json
+import re
+import shutil
 import subprocess
-import time
-from contextlib import contextmanager
-from typing import Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Generator
 
-import rich
+import msgspec
 from packaging import version
-from rich.live import Live
-from rich.table import Table
-from rich.theme import Theme
 
 from ..constants import GCP_PROJECT_NAME, MACOS
 from ..paths import DOCKER_CONFIG_JSON, GCLOUD_ADC_JSON
-from ..termui import Emoji
+from ..termui import DEFAULT_THEME_OBJ, Emoji
+
+
+_OK = f"[success]{Emoji.SUCCESS}[/]"
+_FAIL = f"[error]{Emoji.FAIL}[/]"
 
 
 def command_exists(command: str) -> list[str | Emoji]:
@@ -37,63 +38,48 @@ def command_exists(command: str) -> list[str | Emoji]:
     実行できる場合はインストール済みと判定。
     """
 
-    proc = subprocess.run(
-        ["command", "-v", f"{command}"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.DEVNULL,
-        text=True,
-        check=False,
-    )
-    if proc.returncode == 0:
-        return [command, "インストール済か", f"[success]{Emoji.SUCCESS}[/]", f"[success]{proc.stdout.strip()}[/]"]
+    path = shutil.which(command)
+    if path is not None:
+        return [command, "インストール済か", _OK, f"[success]{path}[/]"]
     else:
-        return [command, "インストール済か", f"[error]{Emoji.FAIL}[/]", ""]
-
-
-def execute_command(command: str) -> str:
-    """引数で指定した文字列をコマンドとして実行し、出力を得る"""
-
-    output = subprocess.check_output(
-        command,
-        shell=True,
-        text=True,
-    )
-    return output.strip()
+        return [command, "インストール済か", _FAIL, ""]
 
 
-VERSION_COMMAND_MAPPING: dict[str, str] = {
-    "gh": "gh version | grep version | awk '{ print $3; }'",
-    "docker": "docker --version | awk '{ print $3; }' | tr -d ','",
-    "docker compose": "docker compose version | awk '{ print $4; }' | sed -e 's/-.*$//g' -e 's/v//g'",
-    "mutagen": "mutagen --version | awk '{ print $3; }'",
-    "gcloud": "gcloud --version 2>/dev/null | grep SDK | awk '{ print $4; }'",
+VERSION_PATTERNS: dict[str, tuple[list[str], re.Pattern[str]]] = {
+    "gh": (["gh", "--version"], re.compile(r"gh version (\S+)")),
+    "docker": (["docker", "--version"], re.compile(r"Docker version ([^,\s]+)")),
+    "docker compose": (["docker", "compose", "version"], re.compile(r"v?(\d+\.\d+\.\d+)")),
+    "mutagen": (["mutagen", "--version"], re.compile(r"(\d+\.\d+\.\d+)")),
+    "gcloud": (["gcloud", "--version"], re.compile(r"Google Cloud SDK (\S+)")),
 }
 
 
-def current_version(command: str):
-    """引数で指定した文字列をコマンドとして実行し、バージョン文字列を得る"""
+def current_version(command: str) -> str:
+    """引数で指定したコマンドを実行し、出力からバージョン文字列を抽出する"""
 
-    return execute_command(VERSION_COMMAND_MAPPING[command])
+    argv, pattern = VERSION_PATTERNS[command]
+    output = subprocess.check_output(argv, stderr=subprocess.DEVNULL, text=True)
+    matched = pattern.search(output)
+    return matched.group(1) if matched else ""
 
 
-def version_satisfied(command: str, required: str) -> list[str | Emoji]:
+def version_satisfied(command: str, required: version.Version) -> list[str | Emoji]:
     """引数で指定したコマンドのバージョンが、任意の要件を満たしているかをテストする"""
 
     current = current_version(command)
     cur = version.parse(current)
-    req = version.parse(required)
-    if cur >= req:
+    if cur >= required:
         return [
             command,
             "バージョン要件を満たしているか",
-            f"[success]{Emoji.SUCCESS}[/]",
+            _OK,
             f"[success]{current}[/] >={required}",
         ]
     else:
         return [
             command,
             "バージョン要件を満たしているか",
-            f"[error]{Emoji.FAIL}[/]",
+            _FAIL,
             f"[error]{current}[/] >={required}",
         ]
 
@@ -101,31 +87,29 @@ def version_satisfied(command: str, required: str) -> list[str | Emoji]:
 def check_ssh_access_on_github() -> list[str | Emoji]:
     """Github に対して ssh 鍵を使ったアクセス設定が完了しているかをテストする"""
 
-    ssh_test_command = "ssh -o 'ConnectTimeout 5' -T git@github.com"
+    ssh_test_command = ["ssh", "-o", "ConnectTimeout=5", "-T", "git@github.com"]
     output = subprocess.run(
         ssh_test_command,
-        stdout=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
-        shell=True,
         text=True,
         check=False,
     )
     message = output.stderr.strip()
     if "You've successfully authenticated" in message:
-        return ["ssh", "Githubに接続可能か", f"[success]{Emoji.SUCCESS}[/]", f"[success]{message}[/]"]
+        return ["ssh", "Githubに接続可能か", _OK, f"[success]{message}[/]"]
     else:
-        return ["ssh", "Githubに接続可能か", f"[error]{Emoji.FAIL}[/]", f"[error]{message}[/]"]
+        return ["ssh", "Githubに接続可能か", _FAIL, f"[error]{message}[/]"]
 
 
 def check_gh_auth_login() -> list[str | Emoji]:
     """gh コマンドを使って Github にログイン済みかどうかをテストする"""
 
-    gh_auth_status_command = "gh auth status"
+    gh_auth_status_command = ["gh", "auth", "status"]
     output = subprocess.run(
         gh_auth_status_command,
-        stdout=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
-        shell=True,
         text=True,
         check=False,
     )
@@ -133,35 +117,33 @@ def check_gh_auth_login() -> list[str | Emoji]:
         return [
             "gh",
             "ログイン済か",
-            f"[error]{Emoji.FAIL}[/]",
+            _FAIL,
             "[error]ログインしていません。gh auth login を実行して Github ホストにログインしてください。[/]",
         ]
     else:
-        return ["gh", "ログイン済か", f"[success]{Emoji.SUCCESS}[/]", ""]
+        return ["gh", "ログイン済か", _OK, ""]
 
 
 def check_docker_daemon() -> list[str | Emoji]:
     """ローカル環境で docker daemon プロセスが実行済みかどうかをテストする"""
 
     if MACOS:
-        pgrep_command = "pgrep com.docker.backend"
+        pgrep_command = ["pgrep", "com.docker.backend"]
     else:
-        pgrep_command = "pgrep -f dockerd"
+        pgrep_command = ["pgrep", "-f", "dockerd"]
     proc = subprocess.run(
         pgrep_command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        shell=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         check=False,
     )
     if proc.returncode == 0:
-        return ["Docker daemon", "プロセス起動済か", f"[success]{Emoji.SUCCESS}[/]", ""]
+        return ["Docker daemon", "プロセス起動済か", _OK, ""]
     else:
         return [
             "Docker daemon",
             "プロセス起動済か",
-            f"[error]{Emoji.FAIL}[/]",
+            _FAIL,
             "[error]プロセスの起動が確認できません。Docker daemon プロセスを起動してください。[/]",
         ]
 
@@ -169,25 +151,26 @@ def check_docker_daemon() -> list[str | Emoji]:
 def check_configure_docker() -> list[str | Emoji]:
     """Google Cloud SDK で docker の設定が完了しているかをテストする"""
 
-    if not DOCKER_CONFIG_JSON.exists():
+    try:
+        config = msgspec.json.decode(DOCKER_CONFIG_JSON.read_bytes())
+    except FileNotFoundError:
         return [
             "Google Cloud",
             "Artifact Registry 連携済か",
-            f"[error]{Emoji.FAIL}[/]",
+            _FAIL,
             "[error]Artifact Registry の連携が未設定です。gcloud auth configure-docker を実行してください。[/]",
         ]
-    config = json.load(open(DOCKER_CONFIG_JSON, "rb"))
     if config.get("credHelpers") is None:
         return [
             "Google Cloud",
             "Artifact Registry 連携済か",
-            f"[error]{Emoji.FAIL}[/]",
+            _FAIL,
             "[error]Artifact Registry の連携が未設定です。gcloud auth configure-docker を実行してください。[/]",
         ]
     return [
         "Google Cloud",
         "Artifact Registry 連携済か",
-        f"[success]{Emoji.SUCCESS}[/]",
+        _OK,
         f"[success]{DOCKER_CONFIG_JSON.absolute()}[/]",
     ]
 
@@ -206,14 +189,14 @@ def check_application_credentials() -> list[str | Emoji]:
         return [
             "Google Cloud",
             "デフォルト認証情報が設定済か",
-            f"[error]{Emoji.FAIL}[/]",
+            _FAIL,
             MESSAGE_CREDENTIAL_NOT_SET,
         ]
     else:
         return [
             "Google Cloud",
             "デフォルト認証情報が設定済か",
-            f"[success]{Emoji.SUCCESS}[/]",
+            _OK,
             f"[success]{GCLOUD_ADC_JSON.absolute()}[/]",
         ]
 
@@ -226,51 +209,89 @@ gcloud services enable --project {GCP_PROJECT_NAME} cloudresourcemanager.googlea
 def check_cloud_resource_manager_enabled() -> list[str | Emoji]:
     """Google Cloud SDK で Resource Manager API が有効化されているかをテストする"""
 
-    command = (
-        "gcloud services list --enabled | grep -q cloudresourcemanager.googleapis.com"
-    )
+    command = ["gcloud", "services", "list", "--enabled", "--format=value(config.name)"]
     proc = subprocess.run(
         command,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        shell=True,
+        stderr=subprocess.DEVNULL,
         text=True,
         check=False,
     )
-    if proc.returncode == 0:
-        return ["Google Cloud", "Resource Manager API が有効化済か", f"[success]{Emoji.SUCCESS}[/]", ""]
+    if proc.returncode == 0 and "cloudresourcemanager.googleapis.com" in proc.stdout:
+        return ["Google Cloud", "Resource Manager API が有効化済か", _OK, ""]
     else:
         return [
             "Google Cloud",
             "Resource Manager API が有効化済か",
-            f"[error]{Emoji.FAIL}[/]",
+            _FAIL,
             MESSAGE_RESOURCE_MGR_API_NOT_ENABLED,
         ]
 
 
-DEFAULT_THEME = {
-    "primary": "cyan",
-    "success": "green",
-    "warning": "yellow",
-    "error": "red",
-    "info": "blue",
-    "req": "bold green",
+TOOL_TEST_CONFIG_MAPPING: dict[str, dict[str, Any]] = {
+    "xcode-select": {"platform": "macos"},
+    "brew": {"platform": "macos"},
+    "make": {},
+    "ssh": {"extras": [(check_ssh_access_on_github, ())]},
+    "jq": {},
+    "pgrep": {},
+    "peco": {},
+    "pipx": {},
+    "gh": {
+        "extras": [
+            (version_satisfied, ("gh", version.parse("2.0.0"))),
+            (check_gh_auth_login, ()),
+        ],
+    },
+    "mutagen": {"extras": [(version_satisfied, ("mutagen", version.parse("0.13.0")))]},
+    "docker": {
+        "extras": [
+            (version_satisfied, ("docker", version.parse("20.10.7"))),
+            (version_satisfied, ("docker compose", version.parse("1.29.2"))),
+            (check_docker_daemon, ()),
+        ],
+    },
+    "gcloud": {
+        "extras": [
+            (version_satisfied, ("gcloud", version.parse("379.0.0"))),
+            (check_configure_docker, ()),
+            (check_application_credentials, ()),
+            (check_cloud_resource_manager_enabled, ()),
+        ],
+    },
 }
+"""テスト対象ツールと追加テストの対応表"""
+
 
-BEAT_TIME = 0.04
+def _flatten(
+    mapping: dict[str, dict[str, Any]],
+) -> Generator[tuple[Callable[..., list[str | Emoji]], tuple[Any, ...]], None, None]:
+    """対応表を実行プラットフォーム向けのテストタスク列に展開する"""
 
+    for tool, config in mapping.items():
+        if config.get("platform") == "macos" and not MACOS:
+            continue
+        yield (command_exists, (tool,))
+        yield from config.get("extras", ())
 
-@contextmanager
-def beat(length: int = 1) -> Generator[None, None, None]:
-    yield
-    time.sleep(length * BEAT_TIME)
+
+_DOCTOR_TASKS: tuple[tuple[Callable[..., list[str | Emoji]], tuple[Any, ...]], ...] = tuple(
+    _flatten(TOOL_TEST_CONFIG_MAPPING)
+)
+"""実行対象のテストタスク一覧"""
+
+MAX_WORKERS = 16
 
 
 def run() -> None:
     """開発作業に必要なツールのインストール状態や設定をテストする"""
 
+    import rich
+    from rich.live import Live
+    from rich.table import Table
+
     console = rich.get_console()
-    console.push_theme(theme=Theme(DEFAULT_THEME))
+    console.push_theme(theme=DEFAULT_THEME_OBJ)
 
     table = Table(title="Doctor result")
     table.add_column("Target", no_wrap=True)
@@ -284,72 +305,7 @@ def run() -> None:
     console.clear()
 
     with Live(table, console=console, screen=False, refresh_per_second=15):
-        if MACOS:
-            with beat(10):
-                command_exists("xcode-select")
-
-            with beat(10):
-                command_exists("brew")
-
-        with beat(10):
-            command_exists("make")
-
-        with beat(10):
-            command_exists("ssh")
-
-        with beat(10):
-            check_ssh_access_on_github()
-
-        with beat(10):
-            command_exists("jq")
-
-        with beat(10):
-            command_exists("pgrep")
-
-        with beat(10):
-            command_exists("peco")
-
-        with beat(10):
-            command_exists("pipx")
-
-        with beat(10):
-            command_exists("gh")
-
-        with beat(10):
-            version_satisfied("gh", "2.0.0")
-
-        with beat(10):
-            check_gh_auth_login()
-
-        with beat(10):
-            command_exists("mutagen")
-
-        with beat(10):
-            version_satisfied("mutagen", "0.13.0")
-
-        with beat(10):
-            command_exists("docker")
-
-        with beat(10):
-            version_satisfied("docker", "20.10.7")
-
-        with beat(10):
-            version_satisfied("docker compose", "1.29.2")
-
-        with beat(10):
-            check_docker_daemon()
-
-        with beat(10):
-            command_exists("gcloud")
-
-        with beat(10):
-            version_satisfied("gcloud", "379.0.0")
-
-        with beat(10):
-            check_configure_docker()
-
-        with beat(10):
-            check_application_credentials()
-
-        with beat(10):
-            check_cloud_resource_manager_enabled()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(func, *args) for func, args in _DOCTOR_TASKS]
+            for future in futures:
+                table.add_row(*future.result())
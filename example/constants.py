@@ -14,21 +14,27 @@
 
 """利用または参照する定数を定義するモジュール"""
 
+import functools
 import platform
 
+import msgspec
+
 from .models.common import CommonGcpProject, CommonJson
 from .models.config import ConfigJson
 from .paths import EXAMPLE_COMMON_JSON, EXAMPLE_CONFIG_JSON
 
 
+_SYSTEM: str = platform.system()
+
+
 def is_macos() -> bool:
     """MacOS か否かを判定する"""
-    return platform.system() == "Darwin"
+    return _SYSTEM == "Darwin"
 
 
 def is_linux() -> bool:
     """Linux か否かを判定する"""
-    return platform.system() == "Linux"
+    return _SYSTEM == "Linux"
 
 
 MACOS: bool = is_macos()
@@ -38,19 +44,17 @@ LINUX: bool = is_linux()
 """実行プラットフォーム環境が Linux か否かを表す定数"""
 
 
+@functools.lru_cache(maxsize=None)
 def get_gcp_project_name(stage: str = "dev") -> str:
     """Google Cloud の個人プロジェクト名を取得する"""
 
-    if EXAMPLE_COMMON_JSON.exists():
-        common: CommonJson = CommonJson.from_json(  # type: ignore
-            open(EXAMPLE_COMMON_JSON, "rb").read(),
-        )
-        return getattr(common.gcp, stage).project
-    else:
-        config: ConfigJson = ConfigJson.from_json(  # type: ignore
-            open(EXAMPLE_CONFIG_JSON, "rb").read(),
-        )
-        return getattr(config.gcp, stage).projects[0].projectName
+    try:
+        data = EXAMPLE_COMMON_JSON.read_bytes()
+    except FileNotFoundError:
+        config = msgspec.json.decode(EXAMPLE_CONFIG_JSON.read_bytes(), type=ConfigJson)
+        return getattr(config.gcp, stage).projects[0].project_name
+    common = msgspec.json.decode(data, type=CommonJson)
+    return getattr(common.gcp, stage).project
 
 
 GCP_PROJECT_NAME: str = get_gcp_project_name()
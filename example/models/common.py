@@ -17,37 +17,26 @@
 filename: common.json
 """
 
-from dataclasses import dataclass
-from pathlib import Path
+import msgspec
 
-from dataclasses_json import LetterCase, dataclass_json
 
-
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
-class CommonGcpProject:
+class CommonGcpProject(msgspec.Struct, rename="camel"):
     project: str
     restricted_project: str
 
 
-@dataclass_json
-@dataclass
-class CommonGcp:
+class CommonGcp(msgspec.Struct):
     dev: CommonGcpProject
     stg: CommonGcpProject
     prod: CommonGcpProject
 
 
-@dataclass_json
-@dataclass
-class CommonRepositories:
+class CommonRepositories(msgspec.Struct):
     app: list[str]
     infra: list[str]
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
-class CommonJson:
+class CommonJson(msgspec.Struct, rename="camel"):
     email: str
-    workspace_path: str | Path
+    workspace_path: str
     gcp: CommonGcp
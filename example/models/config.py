@@ -17,57 +17,42 @@
 filename: config.json
 """
 
-from dataclasses import dataclass
-from pathlib import Path
+import msgspec
 
-from dataclasses_json import LetterCase, dataclass_json
 
-
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
-class ConfigAccount:
+class ConfigAccount(msgspec.Struct, rename="camel"):
     mail_address: str
     company: str
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
-class ConfigWorkspace:
+class ConfigWorkspace(msgspec.Struct, rename="camel"):
     name: str
     activate: bool
-    current_dir: str | Path
+    current_dir: str
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
-class ConfigSlack:
+class ConfigSlack(msgspec.Struct, rename="camel"):
     mension_name: str
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
-class ConfigGcpProjectDetail:
+class ConfigGcpProjectDetail(msgspec.Struct, rename="camel"):
     project_name: str
     restricted_project_name: str
     region: str
     activate: bool
 
 
-@dataclass
-class ConfigGcpProjects:
+class ConfigGcpProjects(msgspec.Struct):
     projects: list[ConfigGcpProjectDetail]
 
 
-@dataclass
-class ConfigGcp:
+class ConfigGcp(msgspec.Struct):
     dev: ConfigGcpProjects
     stg: ConfigGcpProjects
     prod: ConfigGcpProjects
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass
-class ConfigJson:
+class ConfigJson(msgspec.Struct, rename="camel"):
     account: ConfigAccount | None
     workspaces: list[ConfigWorkspace]
     slack: ConfigSlack | None
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import contextlib
 import enum
+import functools
 import os
 import warnings
 from typing import TYPE_CHECKING
@@ -44,16 +45,22 @@ DEFAULT_THEME = {
     "req": "bold green",
 }
 
-_error_console = Console(stderr=True, theme=Theme(DEFAULT_THEME))
+DEFAULT_THEME_OBJ = Theme(DEFAULT_THEME)
+
+_error_console = Console(stderr=True, theme=DEFAULT_THEME_OBJ)
+
+
+_NON_INTERACTIVE: bool = "EXAMPLE_CLI_NON_INTERACTIVE" in os.environ
 
 
 def is_interactive(console: Console | None = None) -> bool:
     """Check if the terminal is run under interactive mode"""
     if console is None:
         console = rich.get_console()
-    return "EXAMPLE_CLI_NON_INTERACTIVE" not in os.environment and console.is_interactive
+    return not _NON_INTERACTIVE and console.is_interactive
 
 
+@functools.lru_cache(maxsize=1)
 def is_legacy_windows(console: Console | None = None) -> bool:
     """Legacy Windows renderer may have problem rendering emojis"""
     if console is None:
@@ -61,6 +68,9 @@ def is_legacy_windows(console: Console | None = None) -> bool:
     return console.legacy_windows
 
 
+_LEGACY_WINDOWS: bool = is_legacy_windows()
+
+
 def style(text: str, *args: str, style: str | None = None, **kwargs: Any) -> str:
     """return text with ansi codes using rich console"""
     _console = rich.get_console()
@@ -96,7 +106,7 @@ class Verbosity(enum.IntEnum):
 
 
 class Emoji:
-    if is_legacy_windows():
+    if _LEGACY_WINDOWS:
         SUCCESS = "v"
         FAIL = "x"
         LOCK = " "
@@ -112,7 +122,7 @@ class Emoji:
         ARROW_SEPARATOR = "➤"
 
 
-if is_legacy_windows():
+if _LEGACY_WINDOWS:
     SPINNER = "line"
 else:
     SPINNER = "dots"